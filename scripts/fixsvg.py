@@ -1,7 +1,5 @@
 #! /usr/bin/env python
 
-from __future__ import print_function, division, absolute_import
-from fontTools.misc.py23 import *
 from fontTools.ttLib import TTFont
 from fontTools.ttLib.tables import otTables
 import xml.etree.ElementTree as ET